@@ -0,0 +1,393 @@
+"""Tests for the Z-Wave services."""
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_HOMEASSISTANT_START
+from homeassistant.components import zwave
+from homeassistant.components.binary_sensor.zwave import get_device
+from homeassistant.components.zwave.const import (
+    ATTR_ASSOCIATION, ATTR_CONFIG_PARAMETER, ATTR_CONFIG_SIZE,
+    ATTR_CONFIG_VALUE, ATTR_GROUP, ATTR_INSTANCE, ATTR_NAME, ATTR_NODE_ID,
+    ATTR_TARGET_NODE_ID, COMMAND_CLASS_CONFIGURATION, COMMAND_CLASS_METER,
+    COMMAND_CLASS_SENSOR_BINARY, COMMAND_CLASS_WAKE_UP, EVENT_NETWORK_STOP,
+    TYPE_LIST)
+from homeassistant.setup import setup_component
+
+import pytest
+from unittest.mock import call, patch, Mock
+
+from tests.common import get_test_home_assistant
+from tests.mock.zwave import (
+    MockNetwork, MockNode, MockValue, MockEntityValues, patch_openzwave)
+
+
+@pytest.fixture(scope='module')
+def zwave_mock_openzwave():
+    """Mock out Open Z-Wave for all tests in this module."""
+    with patch_openzwave() as base_mock:
+        yield base_mock
+
+
+@pytest.fixture(scope='module')
+def zwave_hass(zwave_mock_openzwave):
+    """Return a started Home Assistant with a ready zwave network."""
+    hass = get_test_home_assistant()
+    hass.start()
+
+    # Initialize zwave
+    setup_component(hass, 'zwave', {'zwave': {}})
+    hass.block_till_done()
+    zwave.NETWORK.state = MockNetwork.STATE_READY
+    hass.bus.fire(EVENT_HOMEASSISTANT_START)
+    hass.block_till_done()
+
+    yield hass
+
+    hass.stop()
+
+
+@pytest.fixture
+def zwave_network(zwave_hass, zwave_mock_openzwave):
+    """Give each test a clean view of the shared zwave network.
+
+    Mock calls are reset before the test, so call counts never include
+    calls made by the zwave setup or by tests that ran earlier.
+    """
+    network = zwave.NETWORK
+    nodes = network.nodes
+    state = network.state
+    network.reset_mock()
+    zwave_mock_openzwave.reset_mock()
+
+    yield network
+
+    network.nodes = nodes
+    network.state = state
+    zwave_hass.data[zwave.DATA_ZWAVE_DICT].clear()
+
+
+@pytest.fixture(scope='module')
+def zwave_config_node():
+    """Build the mock node with config and wake-up values once per module."""
+    node = MockNode(node_id=14)
+    node.values = {
+        12: MockValue(
+            index=12,
+            command_class=COMMAND_CLASS_CONFIGURATION,
+        ),
+        13: MockValue(
+            index=13,
+            command_class=COMMAND_CLASS_CONFIGURATION,
+            type=TYPE_LIST,
+            data_items=['item1', 'item2', 'item3'],
+        ),
+        15: MockValue(
+            index=15,
+            command_class=COMMAND_CLASS_WAKE_UP,
+        ),
+    }
+
+    def get_values(class_id):
+        """Return the values of the node for a command class."""
+        return {value_id: value for value_id, value in node.values.items()
+                if value.command_class == class_id}
+
+    node.get_values.side_effect = get_values
+    return node
+
+
+@pytest.fixture
+def mock_node_with_config_values(zwave_config_node, zwave_network):
+    """Add the shared mock node 14 to the zwave network."""
+    node = zwave_config_node
+    node.reset_mock()
+    node.can_wake_up_value = True
+    node.values[12].data = 1234
+    node.values[13].data = 2345
+    node.values[15].data = 3600
+    zwave_network.nodes = {14: node}
+    return node
+
+
+class TestZWaveServices():
+    """Tests for zwave services."""
+
+    @pytest.fixture(autouse=True)
+    def set_zwave_hass(self, zwave_hass, zwave_mock_openzwave, zwave_network):
+        """Use the shared zwave_hass fixture for this class."""
+        self.hass = zwave_hass
+        self.mock_openzwave = zwave_mock_openzwave
+
+    def test_add_node(self):
+        """Test zwave add_node service."""
+        self.hass.services.call('zwave', 'add_node', {})
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.controller.add_node.called
+        assert len(zwave.NETWORK.controller.add_node.mock_calls) == 1
+        assert len(zwave.NETWORK.controller.add_node.mock_calls[0][1]) == 0
+
+    def test_add_node_secure(self):
+        """Test zwave add_node_secure service."""
+        self.hass.services.call('zwave', 'add_node_secure', {})
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.controller.add_node.called
+        assert len(zwave.NETWORK.controller.add_node.mock_calls) == 1
+        assert zwave.NETWORK.controller.add_node.mock_calls[0][1][0] is True
+
+    def test_remove_node(self):
+        """Test zwave remove_node service."""
+        self.hass.services.call('zwave', 'remove_node', {})
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.controller.remove_node.called
+        assert len(zwave.NETWORK.controller.remove_node.mock_calls) == 1
+
+    def test_cancel_command(self):
+        """Test zwave cancel_command service."""
+        self.hass.services.call('zwave', 'cancel_command', {})
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.controller.cancel_command.called
+        assert len(zwave.NETWORK.controller.cancel_command.mock_calls) == 1
+
+    def test_heal_network(self):
+        """Test zwave heal_network service."""
+        self.hass.services.call('zwave', 'heal_network', {})
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.heal.called
+        assert len(zwave.NETWORK.heal.mock_calls) == 1
+
+    def test_soft_reset(self):
+        """Test zwave soft_reset service."""
+        self.hass.services.call('zwave', 'soft_reset', {})
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.controller.soft_reset.called
+        assert len(zwave.NETWORK.controller.soft_reset.mock_calls) == 1
+
+    def test_test_network(self):
+        """Test zwave test_network service."""
+        self.hass.services.call('zwave', 'test_network', {})
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.test.called
+        assert len(zwave.NETWORK.test.mock_calls) == 1
+
+    def test_stop_network(self):
+        """Test zwave stop_network service."""
+        with patch.object(self.hass.bus, 'fire') as mock_fire:
+            self.hass.services.call('zwave', 'stop_network', {})
+            self.hass.block_till_done()
+
+            assert zwave.NETWORK.stop.called
+            assert len(zwave.NETWORK.stop.mock_calls) == 1
+            assert mock_fire.called
+            assert len(mock_fire.mock_calls) == 2
+            assert mock_fire.mock_calls[0][1][0] == EVENT_NETWORK_STOP
+
+    def test_rename_node(self):
+        """Test zwave rename_node service."""
+        zwave.NETWORK.nodes = {11: Mock(spec_set=['name'])}
+        self.hass.services.call('zwave', 'rename_node', {
+            ATTR_NODE_ID: 11,
+            ATTR_NAME: 'test_name',
+        })
+        self.hass.block_till_done()
+
+        assert zwave.NETWORK.nodes[11].name == 'test_name'
+
+    def test_remove_failed_node(self):
+        """Test zwave remove_failed_node service."""
+        self.hass.services.call('zwave', 'remove_failed_node', {
+            ATTR_NODE_ID: 12,
+        })
+        self.hass.block_till_done()
+
+        remove_failed_node = zwave.NETWORK.controller.remove_failed_node
+        assert remove_failed_node.called
+        assert len(remove_failed_node.mock_calls) == 1
+        assert remove_failed_node.mock_calls[0][1][0] == 12
+
+    def test_replace_failed_node(self):
+        """Test zwave replace_failed_node service."""
+        self.hass.services.call('zwave', 'replace_failed_node', {
+            ATTR_NODE_ID: 13,
+        })
+        self.hass.block_till_done()
+
+        replace_failed_node = zwave.NETWORK.controller.replace_failed_node
+        assert replace_failed_node.called
+        assert len(replace_failed_node.mock_calls) == 1
+        assert replace_failed_node.mock_calls[0][1][0] == 13
+
+    def test_set_config_parameter(self, mock_node_with_config_values):
+        """Test zwave set_config_parameter service."""
+        node = mock_node_with_config_values
+
+        self.hass.services.call('zwave', 'set_config_parameter', {
+            ATTR_NODE_ID: 14,
+            ATTR_CONFIG_PARAMETER: 13,
+            ATTR_CONFIG_VALUE: 1,
+        })
+        # Selection out of range of the list value, must be ignored
+        self.hass.services.call('zwave', 'set_config_parameter', {
+            ATTR_NODE_ID: 14,
+            ATTR_CONFIG_PARAMETER: 13,
+            ATTR_CONFIG_VALUE: 7,
+        })
+        self.hass.services.call('zwave', 'set_config_parameter', {
+            ATTR_NODE_ID: 14,
+            ATTR_CONFIG_PARAMETER: 12,
+            ATTR_CONFIG_VALUE: 0x01020304,
+            ATTR_CONFIG_SIZE: 4,
+        })
+        self.hass.block_till_done()
+
+        # Service calls run in the executor, so their order is not fixed
+        assert node.set_config_param.called
+        assert len(node.set_config_param.mock_calls) == 2
+        node.set_config_param.assert_has_calls([
+            call(13, 1, 2),
+            call(12, 0x01020304, 4),
+        ], any_order=True)
+
+    def test_print_config_parameter(self, mock_node_with_config_values):
+        """Test zwave print_config_parameter service."""
+        with patch.object(zwave, '_LOGGER') as mock_logger:
+            self.hass.services.call('zwave', 'print_config_parameter', {
+                ATTR_NODE_ID: 14,
+                ATTR_CONFIG_PARAMETER: 13,
+            })
+            self.hass.block_till_done()
+
+            assert mock_logger.info.called
+            assert len(mock_logger.info.mock_calls) == 1
+            assert mock_logger.info.mock_calls[0][1][1] == 13
+            assert mock_logger.info.mock_calls[0][1][2] == 14
+            assert mock_logger.info.mock_calls[0][1][3] == 2345
+
+    def test_print_node(self):
+        """Test zwave print_config_parameter service."""
+        node1 = MockNode(node_id=14)
+        node2 = MockNode(node_id=15)
+        zwave.NETWORK.nodes = {14: node1, 15: node2}
+
+        with patch.object(zwave, 'pprint') as mock_pprint:
+            self.hass.services.call('zwave', 'print_node', {
+                ATTR_NODE_ID: 15,
+            })
+            self.hass.block_till_done()
+
+            assert mock_pprint.called
+            assert len(mock_pprint.mock_calls) == 1
+            assert mock_pprint.mock_calls[0][1][0]['node_id'] == 15
+
+    def test_set_wakeup(self, mock_node_with_config_values):
+        """Test zwave set_wakeup service."""
+        node = mock_node_with_config_values
+        value = node.values[15]
+
+        self.hass.services.call('zwave', 'set_wakeup', {
+            ATTR_NODE_ID: 14,
+            ATTR_CONFIG_VALUE: 15,
+        })
+        self.hass.block_till_done()
+
+        assert value.data == 15
+        # Config parameters are not touched
+        assert node.values[12].data == 1234
+        assert node.values[13].data == 2345
+
+        node.can_wake_up_value = False
+        self.hass.services.call('zwave', 'set_wakeup', {
+            ATTR_NODE_ID: 14,
+            ATTR_CONFIG_VALUE: 20,
+        })
+        self.hass.block_till_done()
+
+        assert value.data == 15
+
+    def test_add_association(self, mock_node_with_config_values):
+        """Test zwave change_association service."""
+        ZWaveGroup = self.mock_openzwave.group.ZWaveGroup
+        group = Mock(spec_set=['add_association', 'remove_association'])
+        ZWaveGroup.return_value = group
+
+        self.hass.services.call('zwave', 'change_association', {
+            ATTR_ASSOCIATION: 'add',
+            ATTR_NODE_ID: 14,
+            ATTR_TARGET_NODE_ID: 24,
+            ATTR_GROUP: 3,
+            ATTR_INSTANCE: 5,
+        })
+        self.hass.block_till_done()
+
+        assert ZWaveGroup.called
+        assert len(ZWaveGroup.mock_calls) == 2
+        assert ZWaveGroup.mock_calls[0][1][0] == 3
+        assert ZWaveGroup.mock_calls[0][1][2] == 14
+        assert group.add_association.called
+        assert len(group.add_association.mock_calls) == 1
+        assert group.add_association.mock_calls[0][1][0] == 24
+        assert group.add_association.mock_calls[0][1][1] == 5
+
+    def test_remove_association(self, mock_node_with_config_values):
+        """Test zwave change_association service."""
+        ZWaveGroup = self.mock_openzwave.group.ZWaveGroup
+        group = Mock(spec_set=['add_association', 'remove_association'])
+        ZWaveGroup.return_value = group
+
+        self.hass.services.call('zwave', 'change_association', {
+            ATTR_ASSOCIATION: 'remove',
+            ATTR_NODE_ID: 14,
+            ATTR_TARGET_NODE_ID: 24,
+            ATTR_GROUP: 3,
+            ATTR_INSTANCE: 5,
+        })
+        self.hass.block_till_done()
+
+        assert ZWaveGroup.called
+        assert len(ZWaveGroup.mock_calls) == 2
+        assert ZWaveGroup.mock_calls[0][1][0] == 3
+        assert ZWaveGroup.mock_calls[0][1][2] == 14
+        assert group.remove_association.called
+        assert len(group.remove_association.mock_calls) == 1
+        assert group.remove_association.mock_calls[0][1][0] == 24
+        assert group.remove_association.mock_calls[0][1][1] == 5
+
+    def test_refresh_entity(self):
+        """Test zwave refresh_entity service."""
+        node = MockNode()
+        value = MockValue(data=False, node=node,
+                          command_class=COMMAND_CLASS_SENSOR_BINARY)
+        power_value = MockValue(data=50, node=node,
+                                command_class=COMMAND_CLASS_METER)
+        values = MockEntityValues(primary=value, power=power_value)
+        device = get_device(node=node, values=values, node_config={})
+        device.hass = self.hass
+        device.entity_id = 'binary_sensor.mock_entity_id'
+        self.hass.add_job(device.async_added_to_hass())
+        self.hass.block_till_done()
+
+        self.hass.services.call('zwave', 'refresh_entity', {
+            ATTR_ENTITY_ID: 'binary_sensor.mock_entity_id',
+        })
+        self.hass.block_till_done()
+
+        assert node.refresh_value.called
+        assert len(node.refresh_value.mock_calls) == 2
+        assert sorted([node.refresh_value.mock_calls[0][1][0],
+                       node.refresh_value.mock_calls[1][1][0]]) == \
+            sorted([value.value_id, power_value.value_id])
+
+    def test_refresh_node(self):
+        """Test zwave refresh_node service."""
+        node = MockNode(node_id=14)
+        zwave.NETWORK.nodes = {14: node}
+        self.hass.services.call('zwave', 'refresh_node', {
+            ATTR_NODE_ID: 14,
+        })
+        self.hass.block_till_done()
+
+        assert node.refresh_info.called
+        assert len(node.refresh_info.mock_calls) == 1
@@ -3,7 +3,7 @@ import asyncio
 import functools
 import logging
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 import requests_mock as _requests_mock
@@ -14,7 +14,7 @@ from homeassistant.components import mqtt
 
 from tests.common import async_test_home_assistant, mock_coro
 from tests.test_util.aiohttp import mock_aiohttp_client
-from tests.mock.zwave import MockNetwork
+from tests.mock.zwave import patch_openzwave
 
 if os.environ.get('UVLOOP') == '1':
     import uvloop
@@ -97,15 +97,5 @@ def mqtt_mock(loop, hass):
 @pytest.fixture
 def mock_openzwave():
     """Mock out Open Z-Wave."""
-    base_mock = MagicMock()
-    libopenzwave = base_mock.libopenzwave
-    libopenzwave.__file__ = 'test'
-    base_mock.network.ZWaveNetwork = MockNetwork
-
-    with patch.dict('sys.modules', {
-        'libopenzwave': libopenzwave,
-        'openzwave.option': base_mock.option,
-        'openzwave.network': base_mock.network,
-        'openzwave.group': base_mock.group,
-    }):
+    with patch_openzwave() as base_mock:
         yield base_mock
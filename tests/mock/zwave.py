@@ -1,5 +1,6 @@
 """Mock helpers for Z-Wave component."""
-from unittest.mock import MagicMock
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
 
 from pydispatch import dispatcher
 
@@ -183,3 +184,20 @@ class MockEntityValues():
     def __iter__(self):
         """Allow iteration over all values."""
         return iter(self.__dict__.values())
+
+
+@contextmanager
+def patch_openzwave():
+    """Mock out the Open Z-Wave modules and yield the base mock."""
+    base_mock = MagicMock()
+    libopenzwave = base_mock.libopenzwave
+    libopenzwave.__file__ = 'test'
+    base_mock.network.ZWaveNetwork = MockNetwork
+
+    with patch.dict('sys.modules', {
+        'libopenzwave': libopenzwave,
+        'openzwave.option': base_mock.option,
+        'openzwave.network': base_mock.network,
+        'openzwave.group': base_mock.group,
+    }):
+        yield base_mock